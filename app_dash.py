@@ -3,6 +3,11 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import logging
+import os
+import tempfile
 import numpy as np
 
 # Configuração da página
@@ -27,32 +32,101 @@ if uploaded_file is None:
     st.info("Aguardando o upload do arquivo.")
     st.stop()
 
+# Versão do processamento em load_data; incrementar ao alterar as colunas derivadas
+# para invalidar os arquivos Parquet já gravados
+CACHE_VERSAO = 7
+
+logger = logging.getLogger(__name__)
+
+def _normalizar_tipos(serie):
+    """Converte para texto colunas com tipos mistos (ex.: um código numérico entre textos), mantendo NaN"""
+    # O Arrow não converte colunas (nem categorias) de tipos mistos, seja ao gravar o
+    # Parquet, seja ao exibir a tabela
+    if serie.dropna().map(type).nunique() > 1:
+        return serie.where(serie.isna(), serie.astype(str))
+    return serie
+
+def _opcoes_filtros(df):
+    """Valores disponíveis para os filtros da sidebar, calculados uma única vez no carregamento"""
+    return {
+        'anos': tuple(sorted(df['ANO'].dropna().astype(int).unique())),
+        'tipos': tuple(df['TIPO'].dropna().unique()),
+        'especies': tuple(df['ESPÉCIE'].dropna().unique()),
+        'assuntos': tuple(df['ASSUNTO'].dropna().unique()),
+    }
+
 # Cache para carregar dados
 @st.cache_data
 def load_data(file):
-    """Carrega e processa os dados do arquivo Excel a partir de um arquivo carregado"""
+    """Carrega e processa os dados do arquivo Excel, retornando o DataFrame e as opções dos filtros"""
     try:
+        # Identificador do arquivo, usado no cache em disco e no hash das funções em cache abaixo
+        file_hash = hashlib.md5(file.getvalue()).hexdigest()
+        cache_path = os.path.join(tempfile.gettempdir(), f"pad_v{CACHE_VERSAO}_{file_hash}.parquet")
+
+        # Arquivo já processado anteriormente: lê o Parquet em vez do Excel
+        if os.path.exists(cache_path):
+            try:
+                df = pd.read_parquet(cache_path)
+            except Exception:
+                # Cache ilegível (corrompido, truncado ou de outra versão do pyarrow):
+                # descarta o arquivo e segue com a leitura do Excel, que o regrava
+                try:
+                    os.remove(cache_path)
+                except OSError:
+                    pass
+            else:
+                df.attrs['id'] = file_hash
+                return df, _opcoes_filtros(df)
+
         # Lê o arquivo do objeto de upload
         # CORREÇÃO CRÍTICA: Use a variável 'file' que é o objeto do arquivo carregado
         # NÃO use um caminho de arquivo local fixo como 'C:\\Users\\...'
-        df = pd.read_excel(file, sheet_name="PAD")
+        # Leitura com o engine calamine (Rust); todas as colunas são mantidas para a
+        # tabela detalhada e a análise de qualidade dos dados
+        df = pd.read_excel(file, sheet_name="PAD", engine="calamine")
 
         # Processamento de datas
         df['DATA E HORA DE ENTRADA'] = pd.to_datetime(df['DATA E HORA DE ENTRADA'], errors='coerce')
         df['DATA DE ENTRADA'] = pd.to_datetime(df['DATA DE ENTRADA'], errors='coerce')
         
         # Extrair ano e mês para análises temporais
-        df['ANO'] = df['DATA E HORA DE ENTRADA'].dt.year
-        df['MES'] = df['DATA E HORA DE ENTRADA'].dt.month
-        df['MES_ANO'] = df['DATA E HORA DE ENTRADA'].dt.to_period('M')
+        # Inteiros anuláveis de 2 e 1 byte em vez de float64 com NaN
+        df['ANO'] = df['DATA E HORA DE ENTRADA'].dt.year.astype('Int16')
+        df['MES'] = df['DATA E HORA DE ENTRADA'].dt.month.astype('Int8')
+        # MES_ANO como datetime64 truncado no mês (primeiro dia), evitando objetos Period
+        df['MES_ANO'] = df['DATA E HORA DE ENTRADA'].values.astype('datetime64[M]')
+        
+        # Colunas de texto com tipos mistos viram texto, para o Arrow aceitar a gravação
+        # em Parquet e a exibição na tabela detalhada
+        for col in df.select_dtypes(include='object').columns:
+            df[col] = _normalizar_tipos(df[col])
+        
+        # Colunas categóricas usadas em filtros e contagens
+        for col in ['TIPO', 'ESPÉCIE', 'ASSUNTO', 'STATUS', 'DECISAO']:
+            df[col] = df[col].astype('category')
         
-        return df
+        # Grava o DataFrame processado em Parquet; o cache em disco é opcional,
+        # então falhas de gravação (Arrow ou disco) são registradas e não impedem o carregamento
+        try:
+            df.to_parquet(f"{cache_path}.tmp", compression='zstd')
+            os.replace(f"{cache_path}.tmp", cache_path)
+        except (ImportError, OSError, ValueError, TypeError, NotImplementedError) as e:
+            logger.warning("Cache Parquet não gravado em %s: %s", cache_path, e)
+            try:
+                os.remove(f"{cache_path}.tmp")
+            except OSError:
+                pass
+        
+        df.attrs['id'] = file_hash
+        
+        return df, _opcoes_filtros(df)
     except Exception as e:
         st.error(f"Erro ao carregar dados: {e}")
-        return pd.DataFrame()
+        return pd.DataFrame(), {}
 
 # Carregar dados usando o arquivo carregado
-df = load_data(uploaded_file)
+df, opcoes = load_data(uploaded_file)
 
 if df.empty:
     st.error("Não foi possível carregar os dados. Verifique a planilha ou o formato do arquivo.")
@@ -62,7 +136,7 @@ if df.empty:
 st.sidebar.header("🔍 Filtros")
 
 # Filtro por ano
-anos_disponiveis = sorted(df['ANO'].dropna().astype(int).unique())
+anos_disponiveis = opcoes['anos']
 if anos_disponiveis:
     ano_selecionado = st.sidebar.selectbox(
         "Selecione o Ano:",
@@ -73,7 +147,7 @@ else:
     ano_selecionado = 'Todos'
 
 # Filtro por tipo
-tipos_disponiveis = df['TIPO'].dropna().unique()
+tipos_disponiveis = opcoes['tipos']
 tipo_selecionado = st.sidebar.multiselect(
     "Selecione o Tipo:",
     options=tipos_disponiveis,
@@ -81,7 +155,7 @@ tipo_selecionado = st.sidebar.multiselect(
 )
 
 # Filtro por espécie
-especies_disponiveis = df['ESPÉCIE'].dropna().unique()
+especies_disponiveis = opcoes['especies']
 especie_selecionada = st.sidebar.multiselect(
     "Selecione a Espécie:",
     options=especies_disponiveis,
@@ -89,27 +163,111 @@ especie_selecionada = st.sidebar.multiselect(
 )
 
 # Filtro por assunto
-assuntos_disponiveis = df['ASSUNTO'].dropna().unique()
+assuntos_disponiveis = opcoes['assuntos']
 assunto_selecionado = st.sidebar.multiselect(
     "Selecione o Assunto:",
     options=assuntos_disponiveis,
     default=list(assuntos_disponiveis)
 )
 
-# Aplicar filtros
-df_filtrado = df.copy()
+# Limite de combinações de filtros mantidas em cache; cada entrada guarda uma cópia
+# do DataFrame filtrado, então o cache não pode crescer sem limite
+MAX_ENTRADAS_CACHE = 32
+
+def _hash_df(df):
+    """Identifica o DataFrame pelo id gravado em attrs, evitando o hash de todo o conteúdo"""
+    if 'id' in df.attrs:
+        return df.attrs['id']
+    # Sem id gravado, usa o hash do conteúdo (nunca o endereço de memória, que é reutilizado)
+    return (tuple(df.columns), int(pd.util.hash_pandas_object(df).sum()))
+
+def _filtro_inativo(coluna, selecao):
+    """Indica se a seleção cobre todos os valores da coluna, tornando o filtro desnecessário"""
+    # Linhas com valor ausente são excluídas pelo isin, então o filtro só é dispensável sem NaN
+    return not coluna.hasnans and set(selecao) >= set(coluna.cat.categories)
+
+# Cache para aplicar filtros
+@st.cache_data(hash_funcs={pd.DataFrame: _hash_df}, max_entries=MAX_ENTRADAS_CACHE)
+def apply_filters(df, ano, tipos, especies, assuntos):
+    """Aplica os filtros da sidebar; as seleções chegam como tuplas para serem hasheáveis"""
+    # Uma única máscara combinada, aplicada de uma vez ao final
+    mask = np.ones(len(df), dtype=bool)
+    filtrar = False
+
+    if ano != 'Todos':
+        # ANO é Int16 anulável: anos ausentes (<NA>) não passam pelo filtro
+        mask &= (df['ANO'].values == ano).to_numpy(dtype=bool, na_value=False)
+        filtrar = True
+
+    for coluna, selecao in [('TIPO', tipos), ('ESPÉCIE', especies), ('ASSUNTO', assuntos)]:
+        if selecao and not _filtro_inativo(df[coluna], selecao):
+            mask &= df[coluna].isin(selecao).values
+            filtrar = True
+
+    # Sem filtro efetivo, dispensa a máscara e o iloc; a cópia rasa só existe para gravar
+    # attrs sem alterar o DataFrame de origem (o st.cache_data devolve cópias de qualquer forma)
+    df_filtrado = df.iloc[mask] if filtrar else df.copy(deep=False)
+    # Id em texto: attrs segue junto na serialização do st.dataframe e precisa ser JSON
+    chave = repr((df.attrs.get('id'), ano, tipos, especies, assuntos))
+    df_filtrado.attrs['id'] = hashlib.md5(chave.encode()).hexdigest()
+    return df_filtrado
+
+def fast_counts(s):
+    """Contagem de valores sem ordenação, escolhendo o caminho mais rápido conforme o dtype"""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return s.groupby(s, observed=True, sort=False).size()
+    return s.value_counts(sort=False, dropna=True)
+
+# Cache para as contagens usadas nos gráficos
+@st.cache_data(hash_funcs={pd.DataFrame: _hash_df}, max_entries=MAX_ENTRADAS_CACHE)
+def compute_counts(df_filtrado):
+    """Calcula de uma só vez todas as contagens e valores ausentes do DataFrame filtrado"""
+    # Uma única contagem diária, da qual derivam as séries por mês e por ano
+    datas = df_filtrado['DATA E HORA DE ENTRADA'].values.astype('datetime64[D]')
+    # Ordena só o resultado agregado; como diario fica ordenado, as derivadas não precisam de sort
+    diario = df_filtrado.groupby(datas, sort=False).size().sort_index()
+
+    # As quatro contagens categóricas são independentes e rodam em paralelo
+    colunas = ['TIPO', 'ESPÉCIE', 'ASSUNTO', 'DECISAO']
+    with ThreadPoolExecutor(max_workers=len(colunas)) as executor:
+        tipo_counts, especie_counts, assunto_counts, decisao_counts = executor.map(
+            lambda c: fast_counts(df_filtrado[c]), colunas
+        )
 
-if ano_selecionado != 'Todos':
-    df_filtrado = df_filtrado[df_filtrado['ANO'] == ano_selecionado]
+    return {
+        # Métricas principais, sem materializar DataFrames filtrados intermediários
+        'total': len(df_filtrado),
+        'pendentes': int((df_filtrado['STATUS'].values == 'Pendente').sum()),
+        'com_decisao': int(df_filtrado['DECISAO'].notna().values.sum()),
+        'TIPO': tipo_counts,
+        'ESPÉCIE': especie_counts.nlargest(10),
+        'ASSUNTO': assunto_counts.nlargest(10),
+        'DECISAO': decisao_counts,
+        'diario': diario,
+        'MES_ANO': diario.groupby(diario.index.values.astype('datetime64[M]'), sort=False).sum(),
+        'ANO': diario.groupby(diario.index.year, sort=False).sum(),
+        # Valores ausentes coluna a coluna, sem montar o DataFrame booleano completo
+        'missing': pd.Series(
+            {c: int(pd.isna(df_filtrado[c].values).sum()) for c in df_filtrado.columns},
+            dtype='int64'
+        ).sort_values(ascending=False),
+    }
 
-if tipo_selecionado:
-    df_filtrado = df_filtrado[df_filtrado['TIPO'].isin(tipo_selecionado)]
+# Aplicar filtros
+df_filtrado = apply_filters(
+    df,
+    ano_selecionado,
+    tuple(tipo_selecionado),
+    tuple(especie_selecionada),
+    tuple(assunto_selecionado)
+)
 
-if especie_selecionada:
-    df_filtrado = df_filtrado[df_filtrado['ESPÉCIE'].isin(especie_selecionada)]
+# Sem linhas após os filtros, não há o que agregar nem plotar
+if df_filtrado.empty:
+    st.warning("Sem dados para os filtros selecionados.")
+    st.stop()
 
-if assunto_selecionado:
-    df_filtrado = df_filtrado[df_filtrado['ASSUNTO'].isin(assunto_selecionado)]
+counts = compute_counts(df_filtrado)
 
 # Métricas principais
 st.markdown("---")
@@ -117,15 +275,15 @@ st.subheader("📊 Resumo das Métricas")
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    total_processos = len(df_filtrado)
+    total_processos = counts['total']
     st.metric("Total de Processos", total_processos)
 
 with col2:
-    processos_pendentes = len(df_filtrado[df_filtrado['STATUS'] == 'Pendente'])
+    processos_pendentes = counts['pendentes']
     st.metric("Processos Pendentes", processos_pendentes)
 
 with col3:
-    processos_com_decisao = len(df_filtrado[df_filtrado['DECISAO'].notna()])
+    processos_com_decisao = counts['com_decisao']
     st.metric("Processos com Decisão", processos_com_decisao)
 
 with col4:
@@ -134,115 +292,186 @@ with col4:
 
 st.markdown("---")
 
+# Cache para as figuras dos gráficos; os dados chegam como tuplas para serem hasheáveis
+@st.cache_data
+def make_pie(names, values, title):
+    """Monta o gráfico de pizza com percentual e rótulo dentro das fatias"""
+    fig = px.pie(values=list(values), names=list(names), title=title)
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+@st.cache_data
+def make_bar_h(names, values, title, x_label, y_label):
+    """Monta o gráfico de barras horizontais, com a maior barra no topo"""
+    fig = px.bar(
+        x=list(values),
+        y=list(names),
+        orientation='h',
+        title=title,
+        labels={'x': x_label, 'y': y_label}
+    )
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+    return fig
+
+@st.cache_data
+def make_bar(x, y, title, x_label, y_label, tickangle=None):
+    """Monta o gráfico de barras verticais usado nas séries por mês e por ano"""
+    fig = px.bar(x=list(x), y=list(y), title=title, labels={'x': x_label, 'y': y_label})
+    if tickangle is not None:
+        fig.update_xaxes(tickangle=tickangle)
+    return fig
+
 # Layout em duas colunas para os gráficos
 col_left, col_right = st.columns(2)
 
 with col_left:
     # Gráfico de distribuição por tipo
     st.subheader("📊 Distribuição por Tipo")
-    if not df_filtrado['TIPO'].dropna().empty:
-        tipo_counts = df_filtrado['TIPO'].value_counts()
-        fig_tipo = px.pie(
-            values=tipo_counts.values,
-            names=tipo_counts.index,
-            title="Distribuição de Processos por Tipo"
+    tipo_counts = counts['TIPO']
+    if not tipo_counts.empty:
+        fig_tipo = make_pie(
+            tuple(tipo_counts.index),
+            tuple(tipo_counts.values),
+            "Distribuição de Processos por Tipo"
         )
-        fig_tipo.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_tipo, use_container_width=True)
+        st.plotly_chart(fig_tipo, use_container_width=True, key="fig_tipo")
     else:
         st.info("Nenhum dado de tipo disponível para os filtros selecionados.")
 
     # Gráfico de distribuição por espécie
     st.subheader("📋 Distribuição por Espécie")
-    if not df_filtrado['ESPÉCIE'].dropna().empty:
-        especie_counts = df_filtrado['ESPÉCIE'].value_counts().head(10)
-        fig_especie = px.bar(
-            x=especie_counts.values,
-            y=especie_counts.index,
-            orientation='h',
-            title="Top 10 Espécies de Documentos",
-            labels={'x': 'Quantidade', 'y': 'Espécie'}
+    especie_counts = counts['ESPÉCIE']
+    if not especie_counts.empty:
+        fig_especie = make_bar_h(
+            tuple(especie_counts.index),
+            tuple(especie_counts.values),
+            "Top 10 Espécies de Documentos",
+            'Quantidade',
+            'Espécie'
         )
-        fig_especie.update_layout(yaxis={'categoryorder': 'total ascending'})
-        st.plotly_chart(fig_especie, use_container_width=True)
+        st.plotly_chart(fig_especie, use_container_width=True, key="fig_especie")
     else:
         st.info("Nenhum dado de espécie disponível para os filtros selecionados.")
 
 with col_right:
     # Gráfico de distribuição por assunto
     st.subheader("🎯 Distribuição por Assunto")
-    if not df_filtrado['ASSUNTO'].dropna().empty:
-        assunto_counts = df_filtrado['ASSUNTO'].value_counts().head(10)
-        fig_assunto = px.bar(
-            x=assunto_counts.values,
-            y=assunto_counts.index,
-            orientation='h',
-            title="Top 10 Assuntos",
-            labels={'x': 'Quantidade', 'y': 'Assunto'}
+    assunto_counts = counts['ASSUNTO']
+    if not assunto_counts.empty:
+        fig_assunto = make_bar_h(
+            tuple(assunto_counts.index),
+            tuple(assunto_counts.values),
+            "Top 10 Assuntos",
+            'Quantidade',
+            'Assunto'
         )
-        fig_assunto.update_layout(yaxis={'categoryorder': 'total ascending'})
-        st.plotly_chart(fig_assunto, use_container_width=True)
+        st.plotly_chart(fig_assunto, use_container_width=True, key="fig_assunto")
     else:
         st.info("Nenhum dado de assunto disponível para os filtros selecionados.")
 
     # Gráfico de decisões
     st.subheader("⚖️ Distribuição de Decisões")
-    if not df_filtrado['DECISAO'].dropna().empty:
-        decisao_counts = df_filtrado['DECISAO'].value_counts()
-        fig_decisao = px.pie(
-            values=decisao_counts.values,
-            names=decisao_counts.index,
-            title="Distribuição de Decisões dos PADs"
+    decisao_counts = counts['DECISAO']
+    if not decisao_counts.empty:
+        fig_decisao = make_pie(
+            tuple(decisao_counts.index),
+            tuple(decisao_counts.values),
+            "Distribuição de Decisões dos PADs"
         )
-        fig_decisao.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_decisao, use_container_width=True)
+        st.plotly_chart(fig_decisao, use_container_width=True, key="fig_decisao")
     else:
         st.info("Nenhum dado de decisão disponível para os filtros selecionados.")
 
+# Limite de pontos enviados ao navegador no gráfico de linha temporal
+MAX_PONTOS_TEMPORAL = 2000
+
+def lttb_downsample(x, y, n_out):
+    """Retorna os índices dos n_out pontos escolhidos pelo algoritmo LTTB (Largest-Triangle-Three-Buckets)"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # Primeiro e último pontos são sempre mantidos; o restante é dividido em n_out - 2 buckets
+    limites = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        inicio, fim = limites[i], limites[i + 1]
+        prox_fim = limites[i + 2] if i + 2 < len(limites) else n
+        media_x = x[fim:prox_fim].mean()
+        media_y = y[fim:prox_fim].mean()
+
+        # Ponto do bucket que forma o maior triângulo com o ponto anterior e a média do próximo
+        areas = np.abs(
+            (x[a] - media_x) * (y[inicio:fim] - y[a])
+            - (x[a] - x[inicio:fim]) * (media_y - y[a])
+        )
+        a = inicio + int(areas.argmax())
+        indices[i + 1] = a
+
+    return indices
+
 # Análise temporal
 st.markdown("---")
 st.subheader("📈 Análise Temporal")
 
-if not df_filtrado['DATA E HORA DE ENTRADA'].dropna().empty:
+if not counts['diario'].empty:
     # Gráfico de linha temporal
-    df_temporal = df_filtrado.groupby(df_filtrado['DATA E HORA DE ENTRADA'].dt.date).size().reset_index()
-    df_temporal.columns = ['Data', 'Quantidade']
+    df_temporal = counts['diario'].rename_axis('Data').reset_index(name='Quantidade')
+    
+    # Reduz a série com LTTB para não enviar todos os pontos diários ao Plotly
+    if len(df_temporal) > MAX_PONTOS_TEMPORAL:
+        datas_ns = pd.to_datetime(df_temporal['Data']).values.astype('datetime64[ns]').astype(np.int64)
+        indices = lttb_downsample(datas_ns, df_temporal['Quantidade'].values, MAX_PONTOS_TEMPORAL)
+        df_temporal = df_temporal.iloc[indices]
     
-    fig_temporal = px.line(
-        df_temporal,
-        x='Data',
-        y='Quantidade',
+    # Linha em WebGL (Scattergl) em vez de SVG; barras e pizzas continuam em SVG
+    fig_temporal = go.Figure(
+        go.Scattergl(
+            x=df_temporal['Data'],
+            y=df_temporal['Quantidade'],
+            mode='lines'
+        )
+    )
+    fig_temporal.update_layout(
         title="Evolução Temporal dos Processos PAD",
-        labels={'Data': 'Data de Entrada', 'Quantidade': 'Número de Processos'}
+        xaxis_title="Data de Entrada",
+        yaxis_title="Número de Processos"
     )
-    fig_temporal.update_layout(xaxis_title="Data de Entrada", yaxis_title="Número de Processos")
-    st.plotly_chart(fig_temporal, use_container_width=True)
+    st.plotly_chart(fig_temporal, use_container_width=True, key="fig_temporal")
     
     # Análise por mês/ano
     col_temp1, col_temp2 = st.columns(2)
     
     with col_temp1:
-        if not df_filtrado['MES_ANO'].dropna().empty:
-            mes_ano_counts = df_filtrado['MES_ANO'].value_counts().sort_index()
-            fig_mes_ano = px.bar(
-                x=mes_ano_counts.index.astype(str),
-                y=mes_ano_counts.values,
-                title="Processos por Mês/Ano",
-                labels={'x': 'Mês/Ano', 'y': 'Quantidade'}
+        mes_ano_counts = counts['MES_ANO']
+        if not mes_ano_counts.empty:
+            fig_mes_ano = make_bar(
+                tuple(mes_ano_counts.index.strftime('%Y-%m')),
+                tuple(mes_ano_counts.values),
+                "Processos por Mês/Ano",
+                'Mês/Ano',
+                'Quantidade',
+                tickangle=45
             )
-            fig_mes_ano.update_xaxes(tickangle=45)
-            st.plotly_chart(fig_mes_ano, use_container_width=True)
+            st.plotly_chart(fig_mes_ano, use_container_width=True, key="fig_mes_ano")
     
     with col_temp2:
-        if not df_filtrado['ANO'].dropna().empty:
-            ano_counts = df_filtrado['ANO'].value_counts().sort_index()
-            fig_ano = px.bar(
-                x=ano_counts.index,
-                y=ano_counts.values,
-                title="Processos por Ano",
-                labels={'x': 'Ano', 'y': 'Quantidade'}
+        ano_counts = counts['ANO']
+        if not ano_counts.empty:
+            fig_ano = make_bar(
+                tuple(ano_counts.index),
+                tuple(ano_counts.values),
+                "Processos por Ano",
+                'Ano',
+                'Quantidade'
             )
-            st.plotly_chart(fig_ano, use_container_width=True)
+            st.plotly_chart(fig_ano, use_container_width=True, key="fig_ano")
 else:
     st.info("Nenhum dado temporal disponível para os filtros selecionados.")
 
@@ -258,12 +487,31 @@ colunas_selecionadas = st.multiselect(
     default=['ANO/PROTOCOLO', 'DATA DE ENTRADA', 'TIPO', 'ESPÉCIE', 'ASSUNTO', 'DECISAO', 'STATUS']
 )
 
+# Paginação: envia ao navegador apenas uma janela de linhas por vez
+LINHAS_POR_PAGINA = 500
+
 if colunas_selecionadas:
+    total_linhas = len(df_filtrado)
+    total_paginas = (total_linhas - 1) // LINHAS_POR_PAGINA + 1
+    if total_paginas > 1:
+        pagina = st.number_input(
+            f"Página (de {total_paginas}):",
+            min_value=1,
+            max_value=total_paginas,
+            value=1,
+            step=1
+        )
+    else:
+        pagina = 1
+
+    inicio = (pagina - 1) * LINHAS_POR_PAGINA
+    fim = min(inicio + LINHAS_POR_PAGINA, total_linhas)
     st.dataframe(
-        df_filtrado[colunas_selecionadas],
+        df_filtrado.iloc[inicio:fim][colunas_selecionadas],
         use_container_width=True,
         height=400
     )
+    st.caption(f"Exibindo linhas {inicio + 1} a {fim} de {total_linhas}")
 else:
     st.info("Selecione pelo menos uma coluna para exibir os dados.")
 
@@ -275,7 +523,7 @@ col_qual1, col_qual2 = st.columns(2)
 
 with col_qual1:
     st.write("**Valores Ausentes por Coluna:**")
-    missing_data = df_filtrado.isnull().sum().sort_values(ascending=False)
+    missing_data = counts['missing']
     missing_percent = (missing_data / len(df_filtrado) * 100).round(2)
     
     missing_df = pd.DataFrame({
@@ -288,15 +536,14 @@ with col_qual1:
 
 with col_qual2:
     # Gráfico de valores ausentes
-    fig_missing = px.bar(
-        x=missing_percent.values[:10],
-        y=missing_percent.index[:10],
-        orientation='h',
-        title="Top 10 Colunas com Valores Ausentes (%)",
-        labels={'x': 'Percentual de Valores Ausentes (%)', 'y': 'Coluna'}
+    fig_missing = make_bar_h(
+        tuple(missing_percent.index[:10]),
+        tuple(missing_percent.values[:10]),
+        "Top 10 Colunas com Valores Ausentes (%)",
+        'Percentual de Valores Ausentes (%)',
+        'Coluna'
     )
-    fig_missing.update_layout(yaxis={'categoryorder': 'total ascending'})
-    st.plotly_chart(fig_missing, use_container_width=True)
+    st.plotly_chart(fig_missing, use_container_width=True, key="fig_missing")
 
 # Insights e recomendações
 st.markdown("---")